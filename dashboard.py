@@ -5,13 +5,17 @@ A minimal interface to log tasks and post daily summaries.
 """
 
 import streamlit as st
-import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 import subprocess
 import sys
 import os
 
+import profiling
+import rollups
+import storage
+import watcher
+
 # Page configuration
 st.set_page_config(
     page_title="Log2Tweet",
@@ -24,18 +28,11 @@ class TaskLogger:
     
     def __init__(self):
         self.config_dir = Path(__file__).parent
-        self.tasks_file = self.config_dir / "tasks.json"
+        self.tasks_file = storage.active_path(self.config_dir)
         
     def log_task(self, description: str, notes: str = "") -> dict:
         """Log a new task."""
         try:
-            if not self.tasks_file.exists():
-                with open(self.tasks_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f)
-            
-            with open(self.tasks_file, 'r', encoding='utf-8') as f:
-                tasks = json.load(f)
-            
             new_task = {
                 "description": description,
                 "notes": notes,
@@ -44,23 +41,31 @@ class TaskLogger:
                 "timestamp": datetime.now().isoformat()
             }
             
-            tasks.insert(0, new_task)
+            if storage.active_needs_rotation(self.config_dir):
+                storage.rotate_segments(self.config_dir)
             
-            with open(self.tasks_file, 'w', encoding='utf-8') as f:
-                json.dump(tasks, f, indent=2, ensure_ascii=False)
+            storage.append_task(new_task, self.config_dir)
+            rollups.record_task(new_task, self.config_dir)
             
             return {"success": True, "message": "Task logged successfully"}
             
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    def post_summary(self) -> dict:
-        """Post daily summary."""
+    def load_history(self, start_date: str, end_date: str) -> list:
+        """Load tasks in a date range, newest first."""
+        tasks = storage.load_history(start_date, end_date, self.config_dir)
+        return sorted(tasks, key=lambda t: t.get('timestamp', ''), reverse=True)
+    
+    def post_summary(self, dry_run: bool = False) -> dict:
+        """Post daily summary, or only preview it when dry_run is set."""
         try:
             post_script = self.config_dir / "post_daily_summary.py"
             if not post_script.exists():
                 return {"success": False, "error": "post_daily_summary.py not found"}
             
+            command = [sys.executable, str(post_script)] + (["--dry-run"] if dry_run else [])
+            
             # First try with proper encoding
             try:
                 # Set environment variables for proper encoding on Windows
@@ -69,7 +74,7 @@ class TaskLogger:
                 env['PYTHONLEGACYWINDOWSSTDIO'] = 'utf-8'
                 
                 result = subprocess.run(
-                    [sys.executable, str(post_script)],
+                    command,
                     capture_output=True,
                     text=True,
                     cwd=self.config_dir,
@@ -94,7 +99,7 @@ class TaskLogger:
             except UnicodeError:
                 # Fallback: run without capturing output to avoid encoding issues
                 result = subprocess.run(
-                    [sys.executable, str(post_script)],
+                    command,
                     cwd=self.config_dir
                 )
                 
@@ -117,6 +122,30 @@ class TaskLogger:
 # Initialize task logger
 logger = TaskLogger()
 
+# How long the live view waits for new tasks before yielding to Streamlit
+LIVE_POLL_SECONDS = 1.0
+
+@st.cache_resource
+def get_task_watcher() -> watcher.TaskWatcher:
+    """Start one background watcher on tasks.json per dashboard process."""
+    return watcher.TaskWatcher(logger.config_dir).start()
+
+def render_recent_tasks(tasks: list):
+    """Show the 10 most recent tasks, newest first."""
+    if not tasks:
+        if logger.tasks_file.exists():
+            st.info("No tasks logged yet.")
+        else:
+            st.info("No tasks file found. Log your first task to get started!")
+        return
+    
+    recent = sorted(tasks, key=lambda t: t.get('timestamp', ''), reverse=True)[:10]
+    for task in recent:
+        with st.expander(f"{task.get('description', 'No description')} - {task.get('date', 'No date')}"):
+            st.write(f"**Time:** {task.get('time') or task.get('timestamp', '')[11:16] or 'No time'}")
+            if task.get('notes'):
+                st.write(f"**Notes:** {task['notes']}")
+
 def main():
     """Main application."""
     st.title("Log2Tweet")
@@ -128,7 +157,7 @@ def main():
     task_description = st.text_input("What did you accomplish?", placeholder="Enter task description...")
     task_notes = st.text_area("Additional notes (optional)", placeholder="Any extra details...")
     
-    col1, col2 = st.columns([1, 1])
+    col1, col2, col3 = st.columns([1, 1, 1])
     
     with col1:
         if st.button("Log Task", type="primary", use_container_width=True):
@@ -136,6 +165,7 @@ def main():
                 result = logger.log_task(task_description.strip(), task_notes.strip())
                 if result['success']:
                     st.success("Task logged!")
+                    get_task_watcher().poll()
                     st.rerun()
                 else:
                     st.error(f"Error: {result.get('error', 'Unknown error')}")
@@ -155,26 +185,113 @@ def main():
             else:
                 st.error(f"Failed: {result.get('error', 'Unknown error')}")
     
+    with col3:
+        if st.button("Preview Summary", use_container_width=True):
+            with st.spinner("Generating preview..."):
+                result = logger.post_summary(dry_run=True)
+            
+            if result['success']:
+                st.code(result.get('output', ''))
+            else:
+                st.error(f"Failed: {result.get('error', 'Unknown error')}")
+    
     # Recent tasks
     st.header("Recent Tasks")
     
-    if logger.tasks_file.exists():
-        try:
-            with open(logger.tasks_file, 'r', encoding='utf-8') as f:
-                tasks = json.load(f)
-            
-            if tasks:
-                for task in tasks[:10]:  # Show last 10 tasks
-                    with st.expander(f"{task.get('description', 'No description')} - {task.get('date', 'No date')}"):
-                        st.write(f"**Time:** {task.get('time', 'No time')}")
-                        if task.get('notes'):
-                            st.write(f"**Notes:** {task['notes']}")
-            else:
-                st.info("No tasks logged yet.")
-        except Exception as e:
-            st.error(f"Error loading tasks: {e}")
+    live = get_task_watcher()
+    version = live.version
+    live_status = st.empty()
+    recent_placeholder = st.empty()
+    with recent_placeholder.container():
+        render_recent_tasks(live.tasks)
+    
+    # Productivity stats from the incremental rollups
+    st.header("Stats")
+    
+    try:
+        stats = rollups.load_rollups(logger.config_dir)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Total Tasks", stats["total"])
+        col2.metric("Current Streak", f"{rollups.current_streak(stats)} days")
+        col3.metric("Longest Streak", f"{rollups.longest_streak(stats)} days")
+        col4.metric("This Week", stats["weeks"].get(rollups.week_key(datetime.now().strftime("%Y-%m-%d")), 0))
+        
+        st.subheader("Tasks per Day")
+        daily = rollups.daily_series(stats, days=30)
+        st.bar_chart({"Date": list(daily), "Tasks": list(daily.values())}, x="Date", y="Tasks")
+        
+        st.subheader("Tasks per Week")
+        weeks = sorted(stats["weeks"])[-12:]
+        st.bar_chart({"Week": weeks, "Tasks": [stats["weeks"][w] for w in weeks]}, x="Week", y="Tasks")
+        
+        tags = rollups.top_tags(stats)
+        if tags:
+            st.subheader("Top Tags")
+            st.bar_chart({"Tag": list(tags), "Tasks": list(tags.values())}, x="Tag", y="Tasks")
+    except Exception as e:
+        st.error(f"Error loading stats: {e}")
+    
+    # History across archived months
+    st.header("History")
+    
+    today = datetime.now().date()
+    start, end = st.columns([1, 1])
+    with start:
+        start_date = st.date_input("From", value=today - timedelta(days=7))
+    with end:
+        end_date = st.date_input("To", value=today)
+    
+    try:
+        history = logger.load_history(start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
+        if history:
+            st.write(f"{len(history)} tasks")
+            for task in history:
+                st.write(f"**{task.get('date', 'No date')}** - {task.get('description', 'No description')}")
+        else:
+            st.info("No tasks in this range.")
+    except Exception as e:
+        st.error(f"Error loading history: {e}")
+
+    # Profiling reports written by --profile / LOG2TWEET_PROFILE runs
+    st.header("Profiles")
+    
+    reports = profiling.list_reports()
+    if reports:
+        st.dataframe([
+            {
+                "Entry Point": report.get("entry_point"),
+                "Started": report.get("started", "")[:19],
+                "Wall Time (s)": report.get("wall_time"),
+                "Peak Memory (KB)": report.get("peak_memory_kb"),
+                "Exit Code": report.get("exit_code")
+            }
+            for report in reports
+        ], use_container_width=True)
+        
+        latest = reports[0]
+        st.subheader(f"Latest: {latest['file']}")
+        col1, col2 = st.columns(2)
+        col1.metric("Wall Time", f"{latest.get('wall_time', 0):.3f} s")
+        col2.metric("Peak Memory", f"{latest.get('peak_memory_kb', 0):,.0f} KB")
+        st.write("**Top functions (cumulative time)**")
+        st.dataframe(latest.get("top_functions", [])[:10], use_container_width=True)
+        st.write("**Top allocation sites**")
+        st.dataframe(latest.get("top_allocations", [])[:10], use_container_width=True)
     else:
-        st.info("No tasks file found. Log your first task to get started!")
+        st.info("No profiles yet. Run any script with --profile or set LOG2TWEET_PROFILE=1.")
+    
+    # Keep this run alive and redraw the recent tasks whenever the watcher
+    # sees new ones (e.g. logged from log.py). Every pass updates the live
+    # status, and Streamlit only stops or reruns a script inside an st call,
+    # so interactions and closed tabs end this loop within one poll.
+    while True:
+        new_version = live.wait_for_change(version, timeout=LIVE_POLL_SECONDS)
+        live_status.caption(f"🔴 Live · checked {datetime.now().strftime('%H:%M:%S')}")
+        if new_version != version:
+            version = new_version
+            with recent_placeholder.container():
+                render_recent_tasks(live.tasks)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
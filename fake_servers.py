@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - Local Fake API Servers
+Stand-in HTTP servers for Gemini generateContent and Twitter v2 POST /2/tweets,
+with configurable latency, error rate and 429 rate limiting.
+
+Point the pipeline at them by adding "api_base_url" to llm_config.json and
+twitter_config.json (see README). Never use these settings with real keys.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+GEMINI_ROUTE = re.compile(r"^/v1beta/models/([^/:]+):generateContent$")
+TWEETS_ROUTE = "/2/tweets"
+
+
+class ServerBehavior:
+    """How a fake server delays, fails and rate-limits requests."""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0,
+                 rate_limit: int = 0, rate_window: float = 60):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._window_count = 0
+        self.status_counts: Dict[int, int] = {}
+
+    def delay(self):
+        """Sleep for the configured latency plus random jitter."""
+        delay_ms = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def should_fail(self) -> bool:
+        """Decide whether this request gets a simulated server error."""
+        return random.random() < self.error_rate
+
+    def take_rate_limit(self) -> Optional[int]:
+        """Count a request; return the window reset time if the limit is exceeded."""
+        if not self.rate_limit:
+            return None
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= self.rate_window:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            if self._window_count > self.rate_limit:
+                return int(self._window_start + self.rate_window)
+            return None
+
+    def record_status(self, status: int):
+        """Count a response status for reporting."""
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def remaining(self) -> int:
+        """Requests left in the current rate-limit window."""
+        with self._lock:
+            return max(self.rate_limit - self._window_count, 0)
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    """Shared request handling: latency, rate limiting, errors and JSON replies.
+
+    Subclasses define handle_post(body), send_rate_limited(reset) and
+    send_server_error() in the format of the API they imitate.
+    """
+
+    behavior = ServerBehavior()
+
+    def log_message(self, format, *args):
+        """Keep load tests quiet."""
+
+    def send_json(self, status: int, body: Dict, headers: Optional[Dict] = None):
+        """Send a JSON response."""
+        data = json.dumps(body).encode('utf-8')
+        self.behavior.record_status(status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def read_json(self) -> Optional[Dict]:
+        """Read and parse the request body, or None if it is not valid JSON."""
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            return None
+
+    def do_POST(self):
+        """Apply the configured behavior, then route the request."""
+        self.behavior.delay()
+
+        reset = self.behavior.take_rate_limit()
+        if reset is not None:
+            self.send_rate_limited(reset)
+            return
+
+        if self.behavior.should_fail():
+            self.send_server_error()
+            return
+
+        body = self.read_json()
+        if body is None:
+            self.send_json(400, {"error": "Invalid JSON body"})
+            return
+        self.handle_post(body)
+
+
+class FakeGeminiHandler(FakeAPIHandler):
+    """Speaks enough of POST /v1beta/models/{model}:generateContent."""
+
+    def handle_post(self, body: Dict):
+        """Reply with a short tweet built from the bullet points in the prompt."""
+        match = GEMINI_ROUTE.match(self.path.split("?")[0])
+        if not match:
+            self.send_json(404, {"error": {"code": 404, "message": "Not found", "status": "NOT_FOUND"}})
+            return
+
+        prompt = " ".join(
+            part.get("text", "")
+            for content in body.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        task_count = prompt.count("• ")
+        text = f"🚀 Crushed {task_count} tasks today and kept the momentum going! 💪 #BuildInPublic"
+
+        self.send_json(200, {
+            "candidates": [{
+                "content": {"parts": [{"text": text}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0
+            }],
+            "modelVersion": match.group(1)
+        })
+
+    def send_rate_limited(self, reset: int):
+        """Send Gemini's RESOURCE_EXHAUSTED error."""
+        self.send_json(429, {"error": {
+            "code": 429,
+            "message": "Resource has been exhausted (e.g. check quota).",
+            "status": "RESOURCE_EXHAUSTED"
+        }})
+
+    def send_server_error(self):
+        """Send Gemini's UNAVAILABLE error."""
+        self.send_json(503, {"error": {
+            "code": 503,
+            "message": "The model is overloaded. Please try again later.",
+            "status": "UNAVAILABLE"
+        }})
+
+
+class FakeTwitterHandler(FakeAPIHandler):
+    """Speaks enough of Twitter API v2 POST /2/tweets."""
+
+    _ids = iter(range(1700000000000000000, 1800000000000000000))
+    _id_lock = threading.Lock()
+
+    def handle_post(self, body: Dict):
+        """Accept a tweet of up to 280 characters and return its new id."""
+        if self.path.split("?")[0] != TWEETS_ROUTE:
+            self.send_json(404, {"title": "Not Found Error", "status": 404})
+            return
+
+        text = body.get("text", "")
+        if not text or len(text) > 280:
+            self.send_json(403, {
+                "detail": "You are not allowed to create a Tweet with this text.",
+                "title": "Forbidden",
+                "status": 403
+            })
+            return
+
+        with self._id_lock:
+            tweet_id = str(next(self._ids))
+        self.send_json(201, {"data": {"id": tweet_id, "text": text}}, self.rate_limit_headers())
+
+    def rate_limit_headers(self, reset: Optional[int] = None) -> Dict:
+        """Build the x-rate-limit-* headers Twitter sends on every response."""
+        if not self.behavior.rate_limit:
+            return {}
+        return {
+            "x-rate-limit-limit": self.behavior.rate_limit,
+            "x-rate-limit-remaining": self.behavior.remaining(),
+            "x-rate-limit-reset": reset or int(time.time() + self.behavior.rate_window)
+        }
+
+    def send_rate_limited(self, reset: int):
+        """Send Twitter's Too Many Requests error."""
+        self.send_json(429, {"title": "Too Many Requests", "detail": "Too Many Requests", "status": 429},
+                       self.rate_limit_headers(reset))
+
+    def send_server_error(self):
+        """Send Twitter's Service Unavailable error."""
+        self.send_json(503, {"title": "Service Unavailable", "status": 503})
+
+
+def start_server(handler_class: type, behavior: ServerBehavior,
+                 host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start a fake server in a daemon thread. Port 0 picks a free port."""
+    handler = type(handler_class.__name__, (handler_class,), {"behavior": behavior})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    """Return the base URL of a running server."""
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def add_behavior_arguments(parser: argparse.ArgumentParser, prefix: str, name: str):
+    """Add --<prefix>-latency-ms etc. for one fake server."""
+    parser.add_argument(f"--{prefix}-latency-ms", type=float, default=0, help=f"{name} base latency")
+    parser.add_argument(f"--{prefix}-jitter-ms", type=float, default=0, help=f"{name} extra random latency")
+    parser.add_argument(f"--{prefix}-error-rate", type=float, default=0, help=f"{name} 5xx probability (0-1)")
+    parser.add_argument(f"--{prefix}-rate-limit", type=int, default=0,
+                        help=f"{name} requests allowed per window before 429 (0 = unlimited)")
+    parser.add_argument(f"--{prefix}-rate-window", type=float, default=60, help=f"{name} window in seconds")
+
+
+def behavior_from_args(args: argparse.Namespace, prefix: str) -> ServerBehavior:
+    """Build a ServerBehavior from the options added by add_behavior_arguments."""
+    prefix = prefix.replace("-", "_")
+    return ServerBehavior(
+        latency_ms=getattr(args, f"{prefix}_latency_ms"),
+        jitter_ms=getattr(args, f"{prefix}_jitter_ms"),
+        error_rate=getattr(args, f"{prefix}_error_rate"),
+        rate_limit=getattr(args, f"{prefix}_rate_limit"),
+        rate_window=getattr(args, f"{prefix}_rate_window")
+    )
+
+
+def main():
+    """Run both fake servers until interrupted."""
+    parser = argparse.ArgumentParser(description="Run local fake Gemini and Twitter API servers.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--gemini-port", type=int, default=8081)
+    parser.add_argument("--twitter-port", type=int, default=8082)
+    add_behavior_arguments(parser, "gemini", "Gemini")
+    add_behavior_arguments(parser, "twitter", "Twitter")
+    args = parser.parse_args()
+
+    gemini = start_server(FakeGeminiHandler, behavior_from_args(args, "gemini"), args.host, args.gemini_port)
+    twitter = start_server(FakeTwitterHandler, behavior_from_args(args, "twitter"), args.host, args.twitter_port)
+
+    print("🧪 Fake API servers running")
+    print(f"🤖 Gemini:  {server_url(gemini)}")
+    print(f"🐦 Twitter: {server_url(twitter)}")
+    print(f'💡 Add "api_base_url": "{server_url(gemini)}" to llm_config.json')
+    print(f'💡 Add "api_base_url": "{server_url(twitter)}" to twitter_config.json')
+    print("💡 Press Ctrl+C to stop")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("\n🛑 Fake servers stopped")
+        gemini.shutdown()
+        twitter.shutdown()
+
+if __name__ == "__main__":
+    main()
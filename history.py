@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - History Export/Import Script
+Streams task history to and from CSV, Parquet or Arrow files in fixed-size batches.
+
+Usage:
+    python history.py export tasks.parquet --from 2024-01-01 --to 2024-03-31
+    python history.py import tasks.csv
+"""
+
+import argparse
+import csv
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import profiling
+import rollups
+import storage
+
+FIELDS = ["date", "time", "timestamp", "description", "notes"]
+FORMATS = {".csv": "csv", ".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+DEFAULT_BATCH_SIZE = 10000
+
+
+def detect_format(path: Path, requested: Optional[str] = None) -> str:
+    """Pick the file format from --format or the file extension."""
+    if requested:
+        return requested
+    fmt = FORMATS.get(path.suffix.lower())
+    if not fmt:
+        raise ValueError(f"Cannot detect format of {path}; use --format csv|parquet|arrow")
+    return fmt
+
+
+def import_pyarrow():
+    """Import pyarrow, which is only needed for Parquet and Arrow files."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError:
+        raise ValueError("pyarrow not found. Run: pip install pyarrow")
+
+
+def batched(tasks: Iterable[Dict], batch_size: int) -> Iterator[List[Dict]]:
+    """Group a task stream into lists of at most batch_size tasks."""
+    batch = []
+    for task in tasks:
+        batch.append(task)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def to_row(task: Dict) -> Dict:
+    """Project a task onto the export columns."""
+    return {field: task.get(field) or "" for field in FIELDS}
+
+
+def from_row(row: Dict) -> Dict:
+    """Turn an imported row back into a task, dropping empty optional fields."""
+    return {field: row[field] for field in FIELDS if row.get(field)}
+
+
+def export_tasks(path: Path, fmt: str, start_date: Optional[str] = None,
+                 end_date: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Stream tasks in a date range to a columnar file. Returns the task count."""
+    batches = batched(storage.iter_tasks(start_date, end_date), batch_size)
+    count = 0
+
+    if fmt == "csv":
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            for batch in batches:
+                writer.writerows(to_row(task) for task in batch)
+                count += len(batch)
+        return count
+
+    pa = import_pyarrow()
+    schema = pa.schema([(field, pa.string()) for field in FIELDS])
+
+    if fmt == "parquet":
+        writer = pa.parquet.ParquetWriter(str(path), schema)
+    else:
+        writer = pa.ipc.new_file(str(path), schema)
+
+    try:
+        for batch in batches:
+            record_batch = pa.RecordBatch.from_pylist([to_row(task) for task in batch], schema=schema)
+            writer.write_batch(record_batch)
+            count += len(batch)
+    finally:
+        writer.close()
+    return count
+
+
+def read_rows(path: Path, fmt: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict]:
+    """Stream rows from a CSV, Parquet or Arrow file."""
+    if fmt == "csv":
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+        return
+
+    pa = import_pyarrow()
+    if fmt == "parquet":
+        for record_batch in pa.parquet.ParquetFile(str(path)).iter_batches(batch_size=batch_size):
+            yield from record_batch.to_pylist()
+    else:
+        with pa.memory_map(str(path)) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield from reader.get_batch(i).to_pylist()
+
+
+def valid_date(date) -> bool:
+    """Check that a task date is a real YYYY-MM-DD date."""
+    try:
+        datetime.strptime(date, "%Y-%m-%d")
+        return len(date) == 10
+    except (TypeError, ValueError):
+        return False
+
+
+def import_tasks(path: Path, fmt: str, start_date: Optional[str] = None,
+                 end_date: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Stream tasks from a columnar file into the store. Returns the number added.
+
+    Rows without a valid YYYY-MM-DD date are skipped and counted, so they
+    never reach the store.
+    """
+    skipped = 0
+
+    def in_range(task: Dict) -> bool:
+        nonlocal skipped
+        date = task.get('date', '')
+        if not valid_date(date):
+            skipped += 1
+            return False
+        return (not start_date or date >= start_date) and (not end_date or date <= end_date)
+
+    tasks = (from_row(row) for row in read_rows(path, fmt, batch_size))
+    seen = {}
+    added = 0
+    for batch in batched(filter(in_range, tasks), batch_size):
+        added += storage.add_tasks(batch, seen=seen)
+
+    if skipped:
+        print(f"⚠️  Skipped {skipped} rows without a valid YYYY-MM-DD date")
+    if added:
+        rollups.rebuild_rollups()
+    return added
+
+
+def main():
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(description="Export or import Log2Tweet task history.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for command in ("export", "import"):
+        sub = subparsers.add_parser(command)
+        sub.add_argument("path", type=Path, help="CSV, Parquet or Arrow file")
+        sub.add_argument("--format", choices=["csv", "parquet", "arrow"], help="Override format detection")
+        sub.add_argument("--from", dest="start_date", help="First date to include (YYYY-MM-DD)")
+        sub.add_argument("--to", dest="end_date", help="Last date to include (YYYY-MM-DD)")
+        sub.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Tasks per batch")
+
+    args = parser.parse_args()
+
+    try:
+        fmt = detect_format(args.path, args.format)
+        if args.command == "export":
+            count = export_tasks(args.path, fmt, args.start_date, args.end_date, args.batch_size)
+            print(f"📤 Exported {count} tasks to {args.path}")
+        else:
+            if not args.path.exists():
+                print(f"Error: {args.path} not found")
+                sys.exit(1)
+            count = import_tasks(args.path, fmt, args.start_date, args.end_date, args.batch_size)
+            print(f"📥 Imported {count} new tasks from {args.path}")
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    profiling.run(main, "history")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - Nightly Pipeline Load Test
+Runs the summarize-and-post pipeline repeatedly against the local fake
+Gemini and Twitter servers and reports throughput and tail latency.
+
+Usage:
+    python load_test.py --runs 500 --concurrency 8 --gemini-latency-ms 300 --twitter-error-rate 0.05
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import fake_servers
+import post_daily_summary
+import profiling
+
+
+def make_tasks(count: int) -> List[Dict]:
+    """Build a day's worth of synthetic tasks."""
+    now = datetime.now()
+    return [
+        {
+            "description": f"Load test task {i + 1}",
+            "timestamp": now.isoformat(),
+            "date": now.strftime("%Y-%m-%d")
+        }
+        for i in range(count)
+    ]
+
+
+def run_once(tasks: List[Dict], llm_config: Dict, twitter_config: Dict) -> Tuple[float, Optional[str]]:
+    """Run the pipeline once. Returns (seconds, failed stage or None).
+
+    Calls generate_text directly rather than generate_summary_with_llm, so a
+    Gemini error counts as a failed run instead of falling back to the template.
+    """
+    start = time.perf_counter()
+    try:
+        summary = post_daily_summary.generate_text(post_daily_summary.build_summary_prompt(tasks), llm_config)
+    except Exception:
+        return time.perf_counter() - start, "gemini"
+    summary = post_daily_summary.fit_to_tweet(summary)
+    if not post_daily_summary.publish_summary(summary, twitter_config):
+        return time.perf_counter() - start, "twitter"
+    return time.perf_counter() - start, None
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def main():
+    """Start the fake servers, drive the pipeline and print a report."""
+    parser = argparse.ArgumentParser(description="Load test the daily summary pipeline against fake APIs.")
+    parser.add_argument("--runs", type=int, default=200, help="Pipeline runs to execute")
+    parser.add_argument("--concurrency", type=int, default=4, help="Runs in flight at once")
+    parser.add_argument("--tasks", type=int, default=5, help="Tasks per simulated day")
+    parser.add_argument("--timeout", type=float, default=30, help="HTTP timeout per request (seconds)")
+    fake_servers.add_behavior_arguments(parser, "gemini", "Gemini")
+    fake_servers.add_behavior_arguments(parser, "twitter", "Twitter")
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    gemini_behavior = fake_servers.behavior_from_args(args, "gemini")
+    twitter_behavior = fake_servers.behavior_from_args(args, "twitter")
+    gemini = fake_servers.start_server(fake_servers.FakeGeminiHandler, gemini_behavior)
+    twitter = fake_servers.start_server(fake_servers.FakeTwitterHandler, twitter_behavior)
+
+    llm_config = {
+        "gemma_api_key": "fake-key",
+        "model": "gemma-2-9b-it",
+        "api_base_url": fake_servers.server_url(gemini),
+        "timeout": args.timeout
+    }
+    twitter_config = {
+        "api_base_url": fake_servers.server_url(twitter),
+        "timeout": args.timeout
+    }
+    tasks = make_tasks(args.tasks)
+
+    print(f"🧪 Running {args.runs} pipeline runs with concurrency {args.concurrency}...")
+    start = time.perf_counter()
+    # Silence the pipeline's progress output for the whole run; redirect_stdout
+    # swaps a process-wide stream, so it must not be nested per thread.
+    with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda _: run_once(tasks, llm_config, twitter_config), range(args.runs)))
+    elapsed = time.perf_counter() - start
+
+    gemini.shutdown()
+    twitter.shutdown()
+
+    latencies = sorted(seconds * 1000 for seconds, _ in results)
+    posted = sum(1 for _, failed in results if failed is None)
+    gemini_failed = sum(1 for _, failed in results if failed == "gemini")
+    twitter_failed = sum(1 for _, failed in results if failed == "twitter")
+
+    print("-" * 50)
+    print(f"⏱️  Elapsed: {elapsed:.2f} s")
+    print(f"🚀 Throughput: {args.runs / elapsed:.1f} runs/s")
+    print(f"✅ Posted: {posted}/{args.runs}")
+    print(f"❌ Failed: {gemini_failed} at Gemini, {twitter_failed} at Twitter")
+    print(f"📊 Latency (ms): mean {statistics.mean(latencies):.1f}  "
+          f"p50 {percentile(latencies, 50):.1f}  p95 {percentile(latencies, 95):.1f}  "
+          f"p99 {percentile(latencies, 99):.1f}  max {latencies[-1]:.1f}")
+    print(f"🤖 Gemini responses: {dict(sorted(gemini_behavior.status_counts.items()))}")
+    print(f"🐦 Twitter responses: {dict(sorted(twitter_behavior.status_counts.items()))}")
+
+if __name__ == "__main__":
+    profiling.run(main, "load_test")
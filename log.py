@@ -8,23 +8,21 @@ import json
 import sys
 import os
 from datetime import datetime
-from pathlib import Path
+
+import profiling
+import rollups
+import storage
 
 def load_tasks():
-    """Load existing tasks from tasks.json file."""
-    tasks_file = Path("tasks.json")
-    if tasks_file.exists():
-        try:
-            with open(tasks_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
-    return []
+    """Load this month's tasks from the active tasks.json segment."""
+    try:
+        return storage.load_active()
+    except (json.JSONDecodeError, FileNotFoundError):
+        return []
 
 def save_tasks(tasks):
-    """Save tasks to tasks.json file."""
-    with open("tasks.json", 'w', encoding='utf-8') as f:
-        json.dump(tasks, f, indent=2, ensure_ascii=False)
+    """Save tasks to the active tasks.json segment."""
+    storage.save_active(tasks)
 
 def log_task(description):
     """Log a new task with current timestamp."""
@@ -32,16 +30,22 @@ def log_task(description):
         print("Error: Task description cannot be empty")
         return False
     
-    tasks = load_tasks()
-    
     new_task = {
         "description": description.strip(),
         "timestamp": datetime.now().isoformat(),
         "date": datetime.now().strftime("%Y-%m-%d")
     }
     
-    tasks.append(new_task)
-    save_tasks(tasks)
+    try:
+        # Move last month's tasks into the archive before starting a new month
+        if storage.active_needs_rotation():
+            storage.rotate_segments()
+        
+        storage.append_task(new_task)
+        rollups.record_task(new_task)
+    except json.JSONDecodeError:
+        print("Error: Invalid JSON in tasks.json")
+        return False
     
     print(f"✅ Logged: {description}")
     print(f"📅 Date: {new_task['date']}")
@@ -64,4 +68,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main, "log")
@@ -9,10 +9,12 @@ import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-import tweepy
-import google.generativeai as genai
 from typing import List, Dict, Optional
 
+import profiling
+import storage
+import summaries
+
 # LLM Prompt for generating daily summary
 DAILY_SUMMARY_PROMPT = """
 Create a concise, engaging tweet summarizing today's work progress.
@@ -45,15 +47,13 @@ def load_config(config_file: str) -> Dict:
         sys.exit(1)
 
 def load_tasks() -> List[Dict]:
-    """Load tasks from tasks.json file."""
-    tasks_file = Path("tasks.json")
-    if not tasks_file.exists():
+    """Load this month's tasks from the active tasks.json segment."""
+    if not storage.active_path().exists():
         print("No tasks.json file found. Nothing to summarize.")
         return []
     
     try:
-        with open(tasks_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return storage.load_active()
     except json.JSONDecodeError:
         print("Error: Invalid JSON in tasks.json")
         return []
@@ -68,59 +68,109 @@ def generate_summary_with_llm(tasks: List[Dict], llm_config: Dict) -> str:
     if not tasks:
         return "No tasks completed today. Time to get started! 💪"
     
-    # Format tasks for the prompt
-    tasks_text = "\n".join([f"• {task['description']}" for task in tasks])
-    
     try:
-        # Try Gemma API first
-        if 'gemma_api_key' in llm_config and llm_config['gemma_api_key']:
-            # Configure Gemma API
-            genai.configure(api_key=llm_config['gemma_api_key'])
-            
-            # Get the model
-            model = genai.GenerativeModel(llm_config.get('model', 'gemma-2-9b-it'))
-            
-            # Generate content
-            response = model.generate_content(
-                DAILY_SUMMARY_PROMPT.format(tasks_list=tasks_text),
-                generation_config=genai.types.GenerationConfig(
-                    temperature=llm_config.get('temperature', 0.7),
-                    max_output_tokens=llm_config.get('max_tokens', 1000)
-                )
-            )
-            
-            # Handle different response formats
-            if hasattr(response, 'text'):
-                return response.text.strip()
-            elif hasattr(response, 'parts') and response.parts:
-                # Handle complex responses with multiple parts
-                text_parts = []
-                for part in response.parts:
-                    if hasattr(part, 'text'):
-                        text_parts.append(part.text)
-                return ' '.join(text_parts).strip()
-            elif hasattr(response, 'candidates') and response.candidates:
-                # Handle candidate-based responses
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'content') and hasattr(candidate.content, 'parts'):
-                    text_parts = []
-                    for part in candidate.content.parts:
-                        if hasattr(part, 'text'):
-                            text_parts.append(part.text)
-                    return ' '.join(text_parts).strip()
-            else:
-                # Fallback to string representation
-                return str(response).strip()
+        summary = generate_text(build_summary_prompt(tasks), llm_config)
         
         # Fallback to a simple template if no API key
-        else:
+        if summary is None:
             return generate_fallback_summary(tasks)
+        return summary
             
     except Exception as e:
         print(f"Warning: Gemma API call failed: {e}")
         print("Using fallback summary generation...")
         return generate_fallback_summary(tasks)
 
+def build_summary_prompt(tasks: List[Dict]) -> str:
+    """Format tasks into the daily summary prompt."""
+    tasks_text = "\n".join([f"• {task['description']}" for task in tasks])
+    return DAILY_SUMMARY_PROMPT.format(tasks_list=tasks_text)
+
+def generate_text(prompt: str, llm_config: Dict) -> Optional[str]:
+    """Send a prompt to the Gemma API.
+
+    Returns None when no API key is configured; API errors are raised.
+    """
+    if not llm_config.get('gemma_api_key'):
+        return None
+    
+    # Local fake server (see fake_servers.py)
+    if llm_config.get('api_base_url'):
+        return generate_content_via_rest(prompt, llm_config)
+    
+    # Imported here so runs that never call the SDK skip its import cost
+    import google.generativeai as genai
+    
+    # Configure Gemma API
+    genai.configure(api_key=llm_config['gemma_api_key'])
+    
+    # Get the model
+    model = genai.GenerativeModel(llm_config.get('model', 'gemma-2-9b-it'))
+    
+    # Generate content
+    response = model.generate_content(
+        prompt,
+        generation_config=genai.types.GenerationConfig(
+            temperature=llm_config.get('temperature', 0.7),
+            max_output_tokens=llm_config.get('max_tokens', 1000)
+        )
+    )
+    
+    # Handle different response formats
+    if hasattr(response, 'text'):
+        return response.text.strip()
+    elif hasattr(response, 'parts') and response.parts:
+        # Handle complex responses with multiple parts
+        text_parts = []
+        for part in response.parts:
+            if hasattr(part, 'text'):
+                text_parts.append(part.text)
+        return ' '.join(text_parts).strip()
+    elif hasattr(response, 'candidates') and response.candidates:
+        # Handle candidate-based responses
+        candidate = response.candidates[0]
+        if hasattr(candidate, 'content') and hasattr(candidate.content, 'parts'):
+            text_parts = []
+            for part in candidate.content.parts:
+                if hasattr(part, 'text'):
+                    text_parts.append(part.text)
+            return ' '.join(text_parts).strip()
+    
+    # Fallback to string representation
+    return str(response).strip()
+
+def post_json(url: str, body: Dict, headers: Optional[Dict] = None, timeout: float = 30) -> Dict:
+    """POST a JSON body and return the decoded JSON response."""
+    import urllib.request
+    
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode('utf-8'),
+        headers={"Content-Type": "application/json", **(headers or {})},
+        method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+def generate_content_via_rest(prompt: str, llm_config: Dict) -> str:
+    """Call a Gemini-compatible generateContent endpoint at llm_config['api_base_url']."""
+    model = llm_config.get('model', 'gemma-2-9b-it')
+    url = f"{llm_config['api_base_url'].rstrip('/')}/v1beta/models/{model}:generateContent"
+    response = post_json(
+        url,
+        {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "temperature": llm_config.get('temperature', 0.7),
+                "maxOutputTokens": llm_config.get('max_tokens', 1000)
+            }
+        },
+        headers={"x-goog-api-key": llm_config['gemma_api_key']},
+        timeout=llm_config.get('timeout', 30)
+    )
+    parts = response["candidates"][0]["content"]["parts"]
+    return ' '.join(part.get('text', '') for part in parts).strip()
+
 def generate_fallback_summary(tasks: List[Dict]) -> str:
     """Generate a simple summary without external LLM API."""
     if not tasks:
@@ -137,6 +187,17 @@ def generate_fallback_summary(tasks: List[Dict]) -> str:
 def post_to_twitter(summary: str, twitter_config: Dict) -> bool:
     """Post summary to Twitter using Tweepy API v2."""
     try:
+        # Local fake server (see fake_servers.py); sends no OAuth signature
+        if twitter_config.get('api_base_url'):
+            url = f"{twitter_config['api_base_url'].rstrip('/')}/2/tweets"
+            response = post_json(url, {"text": summary}, timeout=twitter_config.get('timeout', 30))
+            print(f"✅ Tweet posted successfully!")
+            print(f"Tweet ID: {response['data']['id']}")
+            return True
+        
+        # Imported here so dry runs and no-task runs skip its import cost
+        import tweepy
+        
         # Use Twitter API v2
         client = tweepy.Client(
             consumer_key=twitter_config['consumer_key'],
@@ -155,23 +216,67 @@ def post_to_twitter(summary: str, twitter_config: Dict) -> bool:
         print(f"Error posting to Twitter: {e}")
         return False
 
-def clear_tasks():
-    """Clear tasks.json file for the next day."""
+def archive_tasks():
+    """Rotate previous months out of tasks.json into the compressed archive."""
     try:
-        with open("tasks.json", 'w', encoding='utf-8') as f:
-            json.dump([], f)
-        print("🧹 Cleared tasks.json for tomorrow")
+        moved = storage.rotate_segments()
+        if moved:
+            print(f"🗄️  Archived {moved} tasks from previous months")
     except Exception as e:
-        print(f"Warning: Could not clear tasks.json: {e}")
+        print(f"Warning: Could not archive tasks.json: {e}")
+
+def prepare_summary(todays_tasks: List[Dict], llm_config: Dict) -> str:
+    """Generate the summary and truncate it to Twitter's limit."""
+    # Generate summary
+    print("🤖 Generating summary with Gemma...")
+    summary = generate_summary_with_llm(todays_tasks, llm_config)
+    return fit_to_tweet(summary)
+
+def fit_to_tweet(summary: str) -> str:
+    """Report the summary's length and truncate it to Twitter's limit."""
+    print(f"📝 Generated summary: {summary}")
+    print(f"📏 Character count: {len(summary)}")
+    
+    # Check character limit and truncate if needed
+    if len(summary) > 280:
+        print("⚠️  Warning: Summary exceeds Twitter's 280 character limit")
+        print(f"📏 Original length: {len(summary)}")
+        summary = summary[:277] + "..."
+        print(f"📏 Truncated to: {len(summary)} characters")
+        print(f"📝 Final summary: {summary}")
+    
+    return summary
+
+def publish_summary(summary: str, twitter_config: Dict) -> bool:
+    """Post a finished summary. Returns True if it was posted."""
+    # Post to Twitter
+    print("🐦 Posting to Twitter...")
+    if post_to_twitter(summary, twitter_config):
+        print("🎉 Daily summary posted successfully!")
+        return True
+    
+    print("❌ Failed to post to Twitter.")
+    return False
 
 def main():
     """Main function to run the daily summary process."""
-    print("🔄 Starting daily summary generation...")
+    dry_run = "--dry-run" in sys.argv[1:] or "--preview" in sys.argv[1:]
+    
+    if dry_run:
+        print("👀 Dry run: previewing summary without posting...")
+    else:
+        print("🔄 Starting daily summary generation...")
     
     # Load configurations
     try:
-        twitter_config = load_config("twitter_config.json")
-        llm_config = load_config("llm_config.json")
+        if dry_run:
+            # A preview needs no Twitter credentials, and falls back to the
+            # template summary when no LLM is configured
+            twitter_config = {}
+            llm_config = load_config("llm_config.json") if Path("llm_config.json").exists() else {}
+        else:
+            twitter_config = load_config("twitter_config.json")
+            llm_config = load_config("llm_config.json")
     except SystemExit:
         return
     
@@ -185,30 +290,31 @@ def main():
     
     print(f"📋 Found {len(todays_tasks)} tasks for today")
     
-    # Generate summary
-    print("🤖 Generating summary with Gemma...")
-    summary = generate_summary_with_llm(todays_tasks, llm_config)
+    # Tasks stay in tasks.json after posting, so guard against a second post
+    today = datetime.now().strftime("%Y-%m-%d")
+    if not dry_run and summaries.is_posted(today):
+        print("✅ Today's summary was already posted. Nothing to do.")
+        return
     
-    print(f"📝 Generated summary: {summary}")
-    print(f"📏 Character count: {len(summary)}")
+    # Reuse today's summary if the tasks have not changed since it was made
+    summary = summaries.get_daily(today, todays_tasks)
+    if summary:
+        print(f"♻️  Reusing cached summary: {summary}")
+    else:
+        summary = prepare_summary(todays_tasks, llm_config)
+        # Template summaries are cheap to rebuild; only cache LLM output
+        if summary != generate_fallback_summary(todays_tasks):
+            summaries.save_daily(today, todays_tasks, summary)
     
-    # Check character limit and truncate if needed
-    if len(summary) > 280:
-        print("⚠️  Warning: Summary exceeds Twitter's 280 character limit")
-        print(f"📏 Original length: {len(summary)}")
-        summary = summary[:277] + "..."
-        print(f"📏 Truncated to: {len(summary)} characters")
-        print(f"📝 Final summary: {summary}")
+    if dry_run:
+        print(f"✅ Preview ready ({len(summary)}/280 characters). Nothing was posted.")
+        return
     
-    # Post to Twitter
-    print("🐦 Posting to Twitter...")
-    if post_to_twitter(summary, twitter_config):
-        print("🎉 Daily summary posted successfully!")
+    if publish_summary(summary, twitter_config):
+        summaries.mark_posted(today)
         
-        # Clear tasks for next day
-        clear_tasks()
-    else:
-        print("❌ Failed to post to Twitter. Tasks not cleared.")
+        # Keep history, but keep the active segment small
+        archive_tasks()
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main, "post_daily_summary")
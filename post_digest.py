@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - Weekly/Monthly Digest Script
+Builds a digest tweet from the cached daily summaries of a week or month
+(map: one summary per day, reduce: one digest), so the prompt stays small
+no matter how many tasks were logged.
+
+Usage:
+    python post_digest.py weekly
+    python post_digest.py monthly --date 2024-03-15 --dry-run
+"""
+
+import argparse
+import hashlib
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import post_daily_summary
+import profiling
+import rollups
+import storage
+import summaries
+
+DIGEST_PROMPT = """
+Create a concise, engaging tweet summarizing this {period_name}'s work progress.
+
+Requirements:
+- MAXIMUM 280 characters (Twitter limit)
+- Use encouraging, positive tone
+- Include 2-3 relevant emojis
+- Highlight the main themes instead of listing every day
+- Make it feel personal and motivational
+
+Daily summaries for {period_label}:
+{summaries_list}
+
+Generate a SHORT tweet (under 280 chars) that captures this {period_name}'s progress:
+"""
+
+PERIODS = {"weekly": "week", "monthly": "month"}
+
+
+def period_bounds(kind: str, day: date) -> Tuple[str, str, str, str]:
+    """Return (start, end, cache key, label) of the week or month containing day."""
+    if kind == "weekly":
+        start = day - timedelta(days=day.weekday())
+        end = start + timedelta(days=6)
+        key = rollups.week_key(start.strftime("%Y-%m-%d"))
+        label = f"the week of {start.strftime('%b %d, %Y')}"
+    else:
+        start = day.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        key = start.strftime("%Y-%m")
+        label = start.strftime("%B %Y")
+    return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"), key, label
+
+
+def tasks_by_day(start: str, end: str) -> Dict[str, List[Dict]]:
+    """Group the tasks in a date range by day, reading only overlapping segments."""
+    days: Dict[str, List[Dict]] = {}
+    for task in storage.iter_tasks(start, end):
+        days.setdefault(task['date'], []).append(task)
+    return days
+
+
+def daily_summaries(days: Dict[str, List[Dict]], llm_config: Dict) -> List[Tuple[str, str, str]]:
+    """Map step: return (date, task hash, summary) for each day, generating only stale or missing ones."""
+    cache = summaries.load_summaries()
+    results = []
+    changed = False
+
+    for day in sorted(days):
+        tasks = days[day]
+        task_hash = summaries.task_set_hash(tasks)
+        entry = cache["daily"].get(day)
+        if entry and entry["hash"] == task_hash:
+            results.append((day, task_hash, entry["summary"]))
+            continue
+
+        print(f"🤖 Summarizing {day} ({len(tasks)} tasks)...")
+        summary = post_daily_summary.generate_summary_with_llm(tasks, llm_config)
+        if summary != post_daily_summary.generate_fallback_summary(tasks):
+            cache["daily"][day] = summaries.daily_entry(tasks, summary)
+            changed = True
+        results.append((day, task_hash, summary))
+
+    if changed:
+        summaries.save_summaries(cache)
+    return results
+
+
+def generate_fallback_digest(kind: str, label: str, days: Dict[str, List[Dict]]) -> str:
+    """Build a simple digest without an external LLM API."""
+    task_count = sum(len(tasks) for tasks in days.values())
+    hashtag = "#WeeklyProgress" if kind == "weekly" else "#MonthlyProgress"
+    return f"📅 Recap for {label}: {task_count} tasks over {len(days)} active days! 💪 {hashtag} #Productivity"
+
+
+def build_digest(kind: str, label: str, days: Dict[str, List[Dict]],
+                 daily: List[Tuple[str, str, str]], llm_config: Dict) -> str:
+    """Reduce step: turn the daily summaries into one digest tweet."""
+    summaries_list = "\n".join(f"• {day}: {summary}" for day, _, summary in daily)
+    prompt = DIGEST_PROMPT.format(
+        period_name=PERIODS[kind],
+        period_label=label,
+        summaries_list=summaries_list
+    )
+    print(f"📏 Digest prompt: {len(prompt)} characters from {len(daily)} daily summaries")
+
+    try:
+        digest = post_daily_summary.generate_text(prompt, llm_config)
+        if digest is not None:
+            return digest
+    except Exception as e:
+        print(f"Warning: Gemma API call failed: {e}")
+        print("Using fallback digest generation...")
+    return generate_fallback_digest(kind, label, days)
+
+
+def main():
+    """Main function to build and post a digest."""
+    parser = argparse.ArgumentParser(description="Post a weekly or monthly digest of daily summaries.")
+    parser.add_argument("kind", choices=sorted(PERIODS), help="Digest period")
+    parser.add_argument("--date", help="Any date inside the period (YYYY-MM-DD, default: today)")
+    parser.add_argument("--dry-run", "--preview", action="store_true", help="Generate without posting")
+    args = parser.parse_args()
+
+    try:
+        day = datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else date.today()
+    except ValueError:
+        print(f"Error: Invalid date {args.date}, expected YYYY-MM-DD")
+        sys.exit(1)
+
+    start, end, key, label = period_bounds(args.kind, day)
+    print(f"🔄 Building {args.kind} digest for {label} ({start} to {end})...")
+
+    # Load configurations
+    try:
+        if args.dry_run:
+            twitter_config = {}
+            llm_config = post_daily_summary.load_config("llm_config.json") if Path("llm_config.json").exists() else {}
+        else:
+            twitter_config = post_daily_summary.load_config("twitter_config.json")
+            llm_config = post_daily_summary.load_config("llm_config.json")
+    except SystemExit:
+        return
+
+    days = tasks_by_day(start, end)
+    if not days:
+        print(f"📝 No tasks found for {label}. Nothing to digest.")
+        return
+
+    daily = daily_summaries(days, llm_config)
+    source_hash = hashlib.sha256("".join(task_hash for _, task_hash, _ in daily).encode('utf-8')).hexdigest()[:16]
+
+    cache = summaries.load_summaries()
+    entry = cache[args.kind].get(key, {})
+    if entry.get("posted") and not args.dry_run:
+        print(f"✅ Digest for {label} was already posted on {entry['posted'][:10]}.")
+        return
+
+    if entry.get("summary") and entry.get("source_hash") == source_hash:
+        digest = entry["summary"]
+        print(f"♻️  Reusing cached digest: {digest}")
+    else:
+        digest = post_daily_summary.fit_to_tweet(build_digest(args.kind, label, days, daily, llm_config))
+        # Template digests are cheap to rebuild; only cache LLM output
+        if digest != generate_fallback_digest(args.kind, label, days):
+            cache[args.kind].setdefault(key, {}).update({
+                "source_hash": source_hash,
+                "days": len(daily),
+                "task_count": sum(len(tasks) for tasks in days.values()),
+                "summary": digest,
+                "created": datetime.now().isoformat()
+            })
+            summaries.save_summaries(cache)
+
+    if args.dry_run:
+        print(f"✅ Preview ready ({len(digest)}/280 characters). Nothing was posted.")
+        return
+
+    print("🐦 Posting to Twitter...")
+    if post_daily_summary.post_to_twitter(digest, twitter_config):
+        print(f"🎉 {args.kind.capitalize()} digest posted successfully!")
+        # Record the posted state for every digest, including template ones
+        cache[args.kind].setdefault(key, {})["posted"] = datetime.now().isoformat()
+        summaries.save_summaries(cache)
+    else:
+        print("❌ Failed to post to Twitter.")
+
+if __name__ == "__main__":
+    profiling.run(main, "post_digest")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - Profiling Mode
+Wraps an entry point with cProfile and tracemalloc when --profile is passed
+or LOG2TWEET_PROFILE is set, and writes a report to the profiles/ directory.
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+if TYPE_CHECKING:
+    import cProfile
+    import tracemalloc
+
+PROFILE_FLAG = "--profile"
+PROFILE_ENV = "LOG2TWEET_PROFILE"
+KEEP_ENV = "LOG2TWEET_PROFILE_KEEP"
+PROFILES_DIR = Path(__file__).parent / "profiles"
+DEFAULT_KEEP = 20
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 15
+
+
+def profiling_enabled() -> bool:
+    """Check the command line flag and the environment switch."""
+    env_value = os.environ.get(PROFILE_ENV, "").strip().lower()
+    return PROFILE_FLAG in sys.argv[1:] or env_value not in ("", "0", "false", "no")
+
+
+def top_functions(profiler: "cProfile.Profile", limit: int = TOP_FUNCTIONS) -> List[Dict]:
+    """Return the functions with the highest cumulative time."""
+    import pstats
+
+    stats = pstats.Stats(profiler).stats
+    ranked = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+    functions = []
+    for (filename, line, name), (_, calls, total_time, cumulative_time, _) in ranked[:limit]:
+        functions.append({
+            "function": f"{name} ({Path(filename).name}:{line})",
+            "calls": calls,
+            "total_time": round(total_time, 6),
+            "cumulative_time": round(cumulative_time, 6)
+        })
+    return functions
+
+
+def top_allocations(snapshot: "tracemalloc.Snapshot", limit: int = TOP_ALLOCATIONS) -> List[Dict]:
+    """Return the source lines holding the most memory at the end of the run."""
+    allocations = []
+    for stat in snapshot.statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        allocations.append({
+            "location": f"{frame.filename}:{frame.lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count
+        })
+    return allocations
+
+
+def prune_reports(keep: int):
+    """Delete the oldest reports beyond the retention limit."""
+    reports = sorted(PROFILES_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for report in reports[keep:]:
+        report.unlink(missing_ok=True)
+        report.with_suffix(".prof").unlink(missing_ok=True)
+
+
+def list_reports() -> List[Dict]:
+    """Load all reports, newest first."""
+    reports = []
+    for path in sorted(PROFILES_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+            report["file"] = path.name
+            reports.append(report)
+        except (json.JSONDecodeError, OSError):
+            continue
+    return reports
+
+
+def run(main: Callable, name: str):
+    """Run an entry point, profiling it if profiling is enabled."""
+    if not profiling_enabled():
+        main()
+        return
+
+    # Profiler modules are only imported when profiling is switched on
+    import cProfile
+    import tracemalloc
+
+    # Hide the flag from the entry point's own argument handling
+    sys.argv = [arg for arg in sys.argv if arg != PROFILE_FLAG]
+
+    started = datetime.now()
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    exit_code = 0
+    error = None
+
+    try:
+        profiler.enable()
+        main()
+    except SystemExit as e:
+        exit_code = e.code
+        raise
+    except BaseException as e:
+        # Crashes and Ctrl+C must not look like clean runs in the report
+        exit_code = 130 if isinstance(e, KeyboardInterrupt) else 1
+        error = repr(e)
+        raise
+    finally:
+        profiler.disable()
+        wall_time = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        report = {
+            "entry_point": name,
+            "started": started.isoformat(),
+            "argv": sys.argv[1:],
+            "exit_code": exit_code,
+            "error": error,
+            "wall_time": round(wall_time, 4),
+            "peak_memory_kb": round(peak / 1024, 1),
+            "top_functions": top_functions(profiler),
+            "top_allocations": top_allocations(snapshot)
+        }
+
+        try:
+            PROFILES_DIR.mkdir(exist_ok=True)
+            stem = f"{name}-{started.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+            with open(PROFILES_DIR / f"{stem}.json", 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            profiler.dump_stats(str(PROFILES_DIR / f"{stem}.prof"))
+            prune_reports(int(os.environ.get(KEEP_ENV, DEFAULT_KEEP)))
+            print(f"⏱️  Profile written to {PROFILES_DIR / stem}.json")
+        except Exception as e:
+            print(f"Warning: Could not write profile report: {e}")
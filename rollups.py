@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - Rollup Statistics
+Maintains per-day, per-week and per-tag task counts in rollups.json,
+updated as each task is logged so the dashboard never rescans history.
+"""
+
+import json
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import storage
+
+ROLLUPS_FILE = "rollups.json"
+
+TAG_PATTERN = re.compile(r"#(\w+)")
+
+
+def rollups_path(base_dir: Path = Path(".")) -> Path:
+    """Return the path of the rollups file next to the task store."""
+    return Path(base_dir) / ROLLUPS_FILE
+
+
+def empty_rollups() -> Dict:
+    """Return an empty rollups structure."""
+    return {"version": 1, "total": 0, "days": {}, "weeks": {}, "tags": {}}
+
+
+def extract_tags(task: Dict) -> List[str]:
+    """Return the lowercase #hashtags found in a task's description and notes."""
+    text = f"{task.get('description', '')} {task.get('notes', '')}"
+    return sorted({tag.lower() for tag in TAG_PATTERN.findall(text)})
+
+
+def week_key(date: str) -> str:
+    """Return the ISO week (e.g. 2024-W07) for a YYYY-MM-DD date."""
+    year, week, _ = datetime.strptime(date, "%Y-%m-%d").isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def add_task(rollups: Dict, task: Dict):
+    """Fold a single task into the rollups in place."""
+    date = task.get('date')
+    if not date:
+        return
+
+    rollups["total"] += 1
+    rollups["days"][date] = rollups["days"].get(date, 0) + 1
+    week = week_key(date)
+    rollups["weeks"][week] = rollups["weeks"].get(week, 0) + 1
+    for tag in extract_tags(task):
+        rollups["tags"][tag] = rollups["tags"].get(tag, 0) + 1
+
+
+def rebuild_rollups(base_dir: Path = Path(".")) -> Dict:
+    """Recompute the rollups from the full task history and save them."""
+    rollups = empty_rollups()
+    for task in storage.iter_tasks(base_dir=base_dir):
+        add_task(rollups, task)
+    save_rollups(rollups, base_dir)
+    return rollups
+
+
+def read_rollups(base_dir: Path = Path(".")) -> Optional[Dict]:
+    """Read the rollups file, or None if it is missing or corrupt."""
+    path = rollups_path(base_dir)
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        return None
+
+
+def load_rollups(base_dir: Path = Path(".")) -> Dict:
+    """Load the rollups, rebuilding them from history if missing or corrupt."""
+    rollups = read_rollups(base_dir)
+    if rollups is None:
+        rollups = rebuild_rollups(base_dir)
+    return rollups
+
+
+def save_rollups(rollups: Dict, base_dir: Path = Path(".")):
+    """Write the rollups file."""
+    data = json.dumps(rollups, indent=2, ensure_ascii=False, sort_keys=True)
+    storage.write_atomic(rollups_path(base_dir), data.encode('utf-8'))
+
+
+def record_task(task: Dict, base_dir: Path = Path(".")):
+    """Update the rollups for a task that has just been appended to the store."""
+    rollups = read_rollups(base_dir)
+    if rollups is None:
+        # The rebuild already sees the new task in the store
+        rebuild_rollups(base_dir)
+        return
+    add_task(rollups, task)
+    save_rollups(rollups, base_dir)
+
+
+def daily_series(rollups: Dict, days: int = 30, today: Optional[datetime] = None) -> Dict[str, int]:
+    """Return task counts for the last N days, including days with no tasks."""
+    end = (today or datetime.now()).date()
+    series = {}
+    for offset in range(days - 1, -1, -1):
+        date = (end - timedelta(days=offset)).strftime("%Y-%m-%d")
+        series[date] = rollups["days"].get(date, 0)
+    return series
+
+
+def current_streak(rollups: Dict, today: Optional[datetime] = None) -> int:
+    """Count consecutive days with tasks, ending today (or yesterday if today is empty)."""
+    day = (today or datetime.now()).date()
+    if day.strftime("%Y-%m-%d") not in rollups["days"]:
+        day -= timedelta(days=1)
+
+    streak = 0
+    while day.strftime("%Y-%m-%d") in rollups["days"]:
+        streak += 1
+        day -= timedelta(days=1)
+    return streak
+
+
+def longest_streak(rollups: Dict) -> int:
+    """Return the longest run of consecutive days with tasks."""
+    longest = 0
+    run = 0
+    previous = None
+    for date in sorted(rollups["days"]):
+        day = datetime.strptime(date, "%Y-%m-%d").date()
+        run = run + 1 if previous and day - previous == timedelta(days=1) else 1
+        longest = max(longest, run)
+        previous = day
+    return longest
+
+
+def top_tags(rollups: Dict, limit: int = 10) -> Dict[str, int]:
+    """Return the most used tags with their counts."""
+    ranked = sorted(rollups["tags"].items(), key=lambda item: (-item[1], item[0]))
+    return dict(ranked[:limit])
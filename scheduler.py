@@ -1,60 +1,81 @@
 #!/usr/bin/env python3
 """
 Log2Tweet - Scheduler Script
-Runs the daily summary posting script at 23:50 every day.
+Runs the daily summary posting script at 23:50 every day, plus weekly
+(Sunday) and monthly (last day of the month) digests at 23:55.
 """
 
 import schedule
 import time
 import subprocess
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
-def run_daily_summary():
-    """Run the daily summary posting script."""
-    print(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Running daily summary...")
+import profiling
+
+def run_script(name: str, script: str, *args: str):
+    """Run one of the posting scripts and report its result."""
+    print(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Running {name}...")
     
     try:
         # Get the directory where this script is located
         script_dir = Path(__file__).parent
-        post_script = script_dir / "post_daily_summary.py"
+        post_script = script_dir / script
         
         if not post_script.exists():
             print(f"❌ Error: {post_script} not found")
             return
         
-        # Run the post_daily_summary.py script
+        # Run the script
         result = subprocess.run(
-            [sys.executable, str(post_script)],
+            [sys.executable, str(post_script), *args],
             capture_output=True,
             text=True,
             cwd=script_dir
         )
         
         if result.returncode == 0:
-            print("✅ Daily summary completed successfully")
+            print(f"✅ {name.capitalize()} completed successfully")
             if result.stdout:
                 print("📝 Output:", result.stdout.strip())
         else:
-            print(f"❌ Daily summary failed with return code {result.returncode}")
+            print(f"❌ {name.capitalize()} failed with return code {result.returncode}")
             if result.stderr:
                 print("🚨 Error:", result.stderr.strip())
                 
     except Exception as e:
-        print(f"❌ Error running daily summary: {e}")
+        print(f"❌ Error running {name}: {e}")
+
+def run_daily_summary():
+    """Run the daily summary posting script."""
+    run_script("daily summary", "post_daily_summary.py")
+
+def run_weekly_digest():
+    """Run the weekly digest for the week ending today."""
+    run_script("weekly digest", "post_digest.py", "weekly")
+
+def run_monthly_digest():
+    """Run the monthly digest, but only on the last day of the month."""
+    if (datetime.now() + timedelta(days=1)).day == 1:
+        run_script("monthly digest", "post_digest.py", "monthly")
 
 def main():
     """Main scheduler function."""
     print("🚀 Log2Tweet Scheduler Starting...")
     print(f"📅 Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("⏰ Will run daily summary at 23:50 every day")
+    print("⏰ Will run weekly digest on Sundays and monthly digest on the last day of the month at 23:55")
     print("💡 Press Ctrl+C to stop the scheduler")
     print("-" * 50)
     
     # Schedule the daily summary to run at 23:50
     schedule.every().day.at("23:50").do(run_daily_summary)
     
+    # Digests run after the daily summary so today's summary is already cached
+    schedule.every().sunday.at("23:55").do(run_weekly_digest)
+    schedule.every().day.at("23:55").do(run_monthly_digest)
+    
     # Also run once immediately if it's after 23:50 (for testing)
     current_hour = datetime.now().hour
     current_minute = datetime.now().minute
@@ -72,4 +93,4 @@ def main():
         print("👋 Goodbye!")
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main, "scheduler")
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - Segmented Task Storage
+Keeps the current month's tasks in tasks.json and rotates older months into
+gzip-compressed monthly segments described by a small manifest.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+ACTIVE_FILE = "tasks.json"
+ARCHIVE_DIR = "archive"
+MANIFEST_FILE = "manifest.json"
+SEGMENT_TEMPLATE = "tasks-{month}.jsonl.gz"
+
+# The active segment is written as a JSON array with one task per line, so a
+# new task can be appended in place by rewriting only the closing bracket.
+ACTIVE_HEAD = b"[\n"
+ACTIVE_TAIL = b"\n]\n"
+
+
+def active_path(base_dir: Path = Path(".")) -> Path:
+    """Return the path of the active (current month) segment."""
+    return Path(base_dir) / ACTIVE_FILE
+
+
+def archive_path(base_dir: Path = Path(".")) -> Path:
+    """Return the directory holding closed monthly segments."""
+    return Path(base_dir) / ARCHIVE_DIR
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write bytes to a temporary file and move it over the target."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _encode_active(tasks: List[Dict]) -> bytes:
+    """Serialize tasks in the one-task-per-line active format."""
+    if not tasks:
+        return ACTIVE_HEAD + b"]\n"
+    lines = [json.dumps(task, ensure_ascii=False) for task in tasks]
+    return ACTIVE_HEAD + ",\n".join(lines).encode('utf-8') + ACTIVE_TAIL
+
+
+def load_active(base_dir: Path = Path(".")) -> List[Dict]:
+    """Load tasks from the active segment.
+
+    Raises json.JSONDecodeError if the file exists but is not valid JSON.
+    """
+    path = active_path(base_dir)
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_active(tasks: List[Dict], base_dir: Path = Path(".")):
+    """Replace the contents of the active segment."""
+    write_atomic(active_path(base_dir), _encode_active(tasks))
+
+
+def append_task(task: Dict, base_dir: Path = Path(".")):
+    """Append a task to the active segment without re-reading it."""
+    append_tasks([task], base_dir)
+
+
+def append_tasks(tasks: List[Dict], base_dir: Path = Path(".")):
+    """Append tasks to the active segment with a single in-place write.
+
+    Falls back to a full rewrite when the file is empty or still in the
+    legacy pretty-printed layout.
+    """
+    if not tasks:
+        return
+    path = active_path(base_dir)
+    lines = b",\n".join(json.dumps(task, ensure_ascii=False).encode('utf-8') for task in tasks)
+
+    if path.exists():
+        with open(path, 'r+b') as f:
+            head = f.read(len(ACTIVE_HEAD) + 1)
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if head == ACTIVE_HEAD + b"{" and size >= len(ACTIVE_HEAD) + len(ACTIVE_TAIL):
+                f.seek(size - len(ACTIVE_TAIL))
+                if f.read() == ACTIVE_TAIL:
+                    f.seek(size - len(ACTIVE_TAIL))
+                    f.write(b",\n" + lines + ACTIVE_TAIL)
+                    return
+
+    save_active(load_active(base_dir) + tasks, base_dir)
+
+
+def load_manifest(base_dir: Path = Path(".")) -> Dict:
+    """Load the archive manifest, or an empty one if none exists yet."""
+    path = archive_path(base_dir) / MANIFEST_FILE
+    if not path.exists():
+        return {"version": 1, "segments": []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest: Dict, base_dir: Path = Path(".")):
+    """Write the archive manifest with segments sorted by month."""
+    manifest["segments"].sort(key=lambda s: s["month"])
+    data = json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+    write_atomic(archive_path(base_dir) / MANIFEST_FILE, data)
+
+
+def iter_segment(path: Path) -> Iterator[Dict]:
+    """Stream tasks from a compressed segment one line at a time."""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _write_segment(path: Path, tasks: List[Dict]):
+    """Write tasks to a compressed JSON Lines segment."""
+    buffer = "".join(json.dumps(task, ensure_ascii=False) + "\n" for task in tasks)
+    write_atomic(path, gzip.compress(buffer.encode('utf-8')))
+
+
+def _task_key(task: Dict) -> tuple:
+    """Identity used to avoid duplicating a task when a segment is merged."""
+    return (task.get('timestamp'), task.get('description'))
+
+
+def rotate_segments(base_dir: Path = Path("."), today: Optional[datetime] = None) -> int:
+    """Move tasks from previous months out of the active segment.
+
+    Each month is merged into its own compressed segment and recorded in the
+    manifest. Returns the number of tasks moved.
+    """
+    current_month = (today or datetime.now()).strftime("%Y-%m")
+    tasks = load_active(base_dir)
+
+    by_month: Dict[str, List[Dict]] = {}
+    remaining = []
+    for task in tasks:
+        month = task.get('date', '')[:7]
+        if month and month < current_month:
+            by_month.setdefault(month, []).append(task)
+        else:
+            remaining.append(task)
+
+    if not by_month:
+        return 0
+
+    manifest = load_manifest(base_dir)
+    entries = {segment["month"]: segment for segment in manifest["segments"]}
+
+    for month, month_tasks in by_month.items():
+        segment_file = SEGMENT_TEMPLATE.format(month=month)
+        segment_path = archive_path(base_dir) / segment_file
+
+        merged = list(iter_segment(segment_path)) if segment_path.exists() else []
+        seen = {_task_key(task) for task in merged}
+        merged.extend(task for task in month_tasks if _task_key(task) not in seen)
+        merged.sort(key=lambda t: t.get('timestamp', ''))
+
+        _write_segment(segment_path, merged)
+        dates = [task['date'] for task in merged]
+        entries[month] = {
+            "month": month,
+            "file": segment_file,
+            "first_date": min(dates),
+            "last_date": max(dates),
+            "count": len(merged),
+            "codec": "gzip"
+        }
+
+    manifest["segments"] = list(entries.values())
+    save_manifest(manifest, base_dir)
+    save_active(remaining, base_dir)
+    return len(tasks) - len(remaining)
+
+
+def _update_manifest_entry(entries: Dict[str, Dict], month: str, tasks: List[Dict]):
+    """Widen a month's manifest entry to cover newly added tasks."""
+    dates = [task['date'] for task in tasks]
+    entry = entries.setdefault(month, {
+        "month": month,
+        "file": SEGMENT_TEMPLATE.format(month=month),
+        "first_date": min(dates),
+        "last_date": max(dates),
+        "count": 0,
+        "codec": "gzip"
+    })
+    entry["first_date"] = min(entry["first_date"], min(dates))
+    entry["last_date"] = max(entry["last_date"], max(dates))
+    entry["count"] += len(tasks)
+
+
+def add_tasks(tasks: List[Dict], base_dir: Path = Path("."), today: Optional[datetime] = None,
+              seen: Optional[Dict[str, Set[tuple]]] = None) -> int:
+    """Add a batch of tasks (e.g. from an import), skipping ones already stored.
+
+    Current-month tasks go to the active segment; older ones are appended to
+    their monthly segment as an extra gzip member, so existing segments are
+    never rewritten, and current-month tasks are appended in place. Pass the
+    same `seen` dict across batches to avoid re-reading each segment's keys.
+    Dedupe keeps one (timestamp, description) key in `seen` for every stored
+    task of each month touched, so that memory grows with those months.
+    Returns the number of tasks added.
+    """
+    current_month = (today or datetime.now()).strftime("%Y-%m")
+    seen = {} if seen is None else seen
+
+    by_month: Dict[str, List[Dict]] = {}
+    for task in tasks:
+        month = task.get('date', '')[:7]
+        if month:
+            by_month.setdefault(month, []).append(task)
+
+    active_additions = []
+    manifest = None
+    added = 0
+    for month, month_tasks in sorted(by_month.items()):
+        if month >= current_month:
+            if current_month not in seen:
+                seen[current_month] = {_task_key(task) for task in load_active(base_dir)}
+            keys = seen[current_month]
+        else:
+            segment_path = archive_path(base_dir) / SEGMENT_TEMPLATE.format(month=month)
+            if month not in seen:
+                existing = iter_segment(segment_path) if segment_path.exists() else []
+                seen[month] = {_task_key(task) for task in existing}
+            keys = seen[month]
+
+        new_tasks = []
+        for task in month_tasks:
+            if _task_key(task) not in keys:
+                keys.add(_task_key(task))
+                new_tasks.append(task)
+        if not new_tasks:
+            continue
+        added += len(new_tasks)
+
+        if month >= current_month:
+            active_additions.extend(new_tasks)
+            continue
+
+        segment_path.parent.mkdir(parents=True, exist_ok=True)
+        buffer = "".join(json.dumps(task, ensure_ascii=False) + "\n" for task in new_tasks)
+        with open(segment_path, 'ab') as f:
+            f.write(gzip.compress(buffer.encode('utf-8')))
+
+        if manifest is None:
+            manifest = load_manifest(base_dir)
+            entries = {segment["month"]: segment for segment in manifest["segments"]}
+        _update_manifest_entry(entries, month, new_tasks)
+
+    if manifest is not None:
+        manifest["segments"] = list(entries.values())
+        save_manifest(manifest, base_dir)
+    append_tasks(active_additions, base_dir)
+    return added
+
+
+def iter_tasks(start_date: Optional[str] = None, end_date: Optional[str] = None,
+               base_dir: Path = Path(".")) -> Iterator[Dict]:
+    """Stream tasks between two YYYY-MM-DD dates (inclusive), oldest month first.
+
+    Only segments whose date range overlaps the requested range are opened.
+    """
+    def in_range(date: str) -> bool:
+        return (not start_date or date >= start_date) and (not end_date or date <= end_date)
+
+    for segment in load_manifest(base_dir)["segments"]:
+        if start_date and segment["last_date"] < start_date:
+            continue
+        if end_date and segment["first_date"] > end_date:
+            continue
+        for task in iter_segment(archive_path(base_dir) / segment["file"]):
+            if in_range(task.get('date', '')):
+                yield task
+
+    for task in load_active(base_dir):
+        if in_range(task.get('date', '')):
+            yield task
+
+
+def load_history(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 base_dir: Path = Path(".")) -> List[Dict]:
+    """Load tasks between two YYYY-MM-DD dates from the archive and active segment."""
+    return list(iter_tasks(start_date, end_date, base_dir))
+
+
+def active_needs_rotation(base_dir: Path = Path("."), today: Optional[datetime] = None) -> bool:
+    """Check the first task of the active segment for a previous month.
+
+    Only the first line is read, so this is cheap enough to call on every log.
+    """
+    path = active_path(base_dir)
+    if not path.exists():
+        return False
+    with open(path, 'rb') as f:
+        head = f.read(len(ACTIVE_HEAD))
+        first = f.readline().rstrip(b",\r\n")
+    if head != ACTIVE_HEAD or not first.startswith(b"{"):
+        # Legacy or empty layout: let rotate_segments inspect the whole file
+        return head != ACTIVE_HEAD or first != b"]"
+    try:
+        first_task = json.loads(first)
+    except json.JSONDecodeError:
+        return True
+    current_month = (today or datetime.now()).strftime("%Y-%m")
+    return first_task.get('date', '')[:7] < current_month
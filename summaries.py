@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - Summary Cache
+Stores each day's generated summary in summaries.json together with a hash of
+the tasks it was built from, plus the weekly and monthly digests built on top
+and the dates whose daily summary has already been posted.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import storage
+
+SUMMARIES_FILE = "summaries.json"
+
+
+def summaries_path(base_dir: Path = Path(".")) -> Path:
+    """Return the path of the summary cache next to the task store."""
+    return Path(base_dir) / SUMMARIES_FILE
+
+
+def load_summaries(base_dir: Path = Path(".")) -> Dict:
+    """Load the summary cache, or an empty one if missing or corrupt."""
+    path = summaries_path(base_dir)
+    if path.exists():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            print(f"Warning: Invalid JSON in {SUMMARIES_FILE}, starting a new cache")
+    return {"version": 1, "daily": {}, "weekly": {}, "monthly": {}, "posted": {}}
+
+
+def save_summaries(summaries: Dict, base_dir: Path = Path(".")):
+    """Write the summary cache."""
+    data = json.dumps(summaries, indent=2, ensure_ascii=False, sort_keys=True)
+    storage.write_atomic(summaries_path(base_dir), data.encode('utf-8'))
+
+
+def task_set_hash(tasks: List[Dict]) -> str:
+    """Hash a day's tasks independently of their order."""
+    keys = sorted(f"{task.get('timestamp', '')}\t{task.get('description', '')}" for task in tasks)
+    return hashlib.sha256("\n".join(keys).encode('utf-8')).hexdigest()[:16]
+
+
+def get_daily(date: str, tasks: List[Dict], base_dir: Path = Path(".")) -> Optional[str]:
+    """Return the cached summary for a day if it was built from these exact tasks."""
+    entry = load_summaries(base_dir)["daily"].get(date)
+    if entry and entry["hash"] == task_set_hash(tasks):
+        return entry["summary"]
+    return None
+
+
+def daily_entry(tasks: List[Dict], summary: str) -> Dict:
+    """Build the cache entry for a day's summary."""
+    return {
+        "hash": task_set_hash(tasks),
+        "task_count": len(tasks),
+        "summary": summary,
+        "created": datetime.now().isoformat()
+    }
+
+
+def save_daily(date: str, tasks: List[Dict], summary: str, base_dir: Path = Path(".")):
+    """Store a day's summary with the hash of its tasks."""
+    summaries = load_summaries(base_dir)
+    summaries["daily"][date] = daily_entry(tasks, summary)
+    save_summaries(summaries, base_dir)
+
+
+def is_posted(date: str, base_dir: Path = Path(".")) -> bool:
+    """Check whether the daily summary for a date has already been posted."""
+    return date in load_summaries(base_dir).get("posted", {})
+
+
+def mark_posted(date: str, base_dir: Path = Path(".")):
+    """Record that the daily summary for a date was posted."""
+    summaries = load_summaries(base_dir)
+    summaries.setdefault("posted", {})[date] = datetime.now().isoformat()
+    save_summaries(summaries, base_dir)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Log2Tweet - Task Store Watcher
+Polls tasks.json in a background thread and parses only the bytes appended
+since the last check, so the dashboard can show new tasks without reloading.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import storage
+
+MIN_INTERVAL = 0.25
+MAX_INTERVAL = 5.0
+
+
+class TaskWatcher:
+    """Keeps an in-memory copy of the active segment in sync with the file."""
+
+    def __init__(self, base_dir: Path = Path(".")):
+        self.path = storage.active_path(base_dir)
+        self.base_dir = Path(base_dir)
+        self.version = 0
+        self._tasks: List[Dict] = []
+        self._inode: Optional[int] = None
+        self._size = 0
+        self._changed = threading.Condition()
+        self._poll_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="TaskWatcher", daemon=True)
+
+    def start(self) -> "TaskWatcher":
+        """Load the current tasks and start polling in the background."""
+        self.poll()
+        self._thread.start()
+        return self
+
+    @property
+    def tasks(self) -> List[Dict]:
+        """Return a snapshot of the tasks currently in the active segment."""
+        with self._changed:
+            return list(self._tasks)
+
+    def wait_for_change(self, version: int, timeout: Optional[float] = None) -> int:
+        """Block until the tasks change from the given version, or the timeout expires."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+    def _run(self):
+        """Poll the file, backing off while nothing changes."""
+        interval = MIN_INTERVAL
+        while True:
+            time.sleep(interval)
+            try:
+                changed = self.poll()
+            except Exception:
+                changed = False
+            interval = MIN_INTERVAL if changed else min(interval * 2, MAX_INTERVAL)
+
+    def poll(self) -> bool:
+        """Check the file once. Returns True if the tasks changed."""
+        with self._poll_lock:
+            return self._poll()
+
+    def _poll(self) -> bool:
+        """Compare the file against the last seen state and pick up changes."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self._inode is None and not self._tasks:
+                return False
+            self._publish([], None, 0)
+            return True
+
+        if stat.st_ino == self._inode and stat.st_size == self._size:
+            return False
+
+        # append_task writes in place, so a grown file with the same inode
+        # only needs its new tail parsed; anything else is a rewrite.
+        if stat.st_ino == self._inode and stat.st_size > self._size:
+            new_tasks = self._read_appended(stat.st_size)
+            if new_tasks is not None:
+                self._publish(self._tasks + new_tasks, stat.st_ino, stat.st_size)
+                return True
+
+        try:
+            tasks = storage.load_active(self.base_dir)
+        except json.JSONDecodeError:
+            # Caught mid-write; try again on the next poll
+            return False
+        self._publish(tasks, stat.st_ino, stat.st_size)
+        return True
+
+    def _read_appended(self, size: int) -> Optional[List[Dict]]:
+        """Parse the tasks added since the last poll, or None if a full reload is needed."""
+        start = self._size - len(storage.ACTIVE_TAIL)
+        if start < len(storage.ACTIVE_HEAD):
+            return None
+
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            appended = f.read(size - start)
+
+        if not appended.startswith(b",\n") or not appended.endswith(storage.ACTIVE_TAIL):
+            return None
+
+        tasks = []
+        for line in appended.splitlines():
+            line = line.strip().rstrip(b",")
+            if not line.startswith(b"{"):
+                continue
+            try:
+                tasks.append(json.loads(line))
+            except json.JSONDecodeError:
+                return None
+        return tasks
+
+    def _publish(self, tasks: List[Dict], inode: Optional[int], size: int):
+        """Swap in the new task list and wake any waiting readers."""
+        with self._changed:
+            self._tasks = tasks
+            self._inode = inode
+            self._size = size
+            self.version += 1
+            self._changed.notify_all()